@@ -1,4 +1,5 @@
 import logging
+import os
 import shlex
 import subprocess
 from pathlib import Path
@@ -34,6 +35,9 @@ def run_git_command(args: list[str], cwd: str | Path) -> str:
             text=True,
             check=False,
             timeout=30,  # Prevent hanging commands
+            # Never block on a credential prompt, and don't take optional
+            # locks (e.g. index refresh) that contend with the agent's own git
+            env={**os.environ, "GIT_TERMINAL_PROMPT": "0", "GIT_OPTIONAL_LOCKS": "0"},
         )
 
         if result.returncode != 0:
@@ -171,15 +175,15 @@ def validate_git_repository(repo_dir: str | Path) -> Path:
     """
     repo_path = Path(repo_dir).resolve()
 
-    if not repo_path.exists():
-        raise GitRepositoryError(f"Directory does not exist: {repo_path}")
-
-    if not repo_path.is_dir():
+    # A single stat covers the common case; only tell the failures apart
+    # once we know the path is not a directory
+    if not os.path.isdir(repo_path):
+        if not os.path.exists(repo_path):
+            raise GitRepositoryError(f"Directory does not exist: {repo_path}")
         raise GitRepositoryError(f"Path is not a directory: {repo_path}")
 
     # Check if it's a git repository by looking for .git directory or file
-    git_dir = repo_path / ".git"
-    if not git_dir.exists():
+    if not os.path.exists(os.path.join(repo_path, ".git")):
         # Maybe we're in a subdirectory, try to find the git root
         try:
             run_git_command(["git", "rev-parse", "--git-dir"], repo_path)
@@ -1,3 +1,4 @@
+import sys
 from typing import Any
 
 from cachetools import LRUCache
@@ -19,6 +20,8 @@ class MemoryLRUCache(LRUCache):
 
     Note: Memory tracking is based on string length for simplicity and accuracy.
     For non-string values, sys.getsizeof is used as a rough approximation.
+    The size of each entry is computed once on insertion and remembered, so
+    updates, deletions and evictions never need to re-measure a value.
     """
 
     def __init__(self, max_memory: int, max_size: int, *args, **kwargs):
@@ -27,6 +30,7 @@ class MemoryLRUCache(LRUCache):
         super().__init__(maxsize=maxsize, *args, **kwargs)
         self.max_memory = max_memory
         self.current_memory = 0
+        self._sizes: dict[Any, int] = {}
 
     def _get_size(self, value: Any) -> int:
         """Calculate size of value for memory tracking.
@@ -46,8 +50,6 @@ class MemoryLRUCache(LRUCache):
             # This is mainly for edge cases and won't be accurate for nested
             # structures, but it's better than nothing
             try:
-                import sys
-
                 return sys.getsizeof(value)
             except Exception:
                 return 0
@@ -65,10 +67,7 @@ class MemoryLRUCache(LRUCache):
             return
 
         # Update memory accounting if key exists
-        if key in self:
-            old_value = self[key]
-            self.current_memory -= self._get_size(old_value)
-
+        self.current_memory -= self._sizes.pop(key, 0)
         self.current_memory += new_size
 
         # Evict items until we're under memory limit
@@ -76,10 +75,14 @@ class MemoryLRUCache(LRUCache):
             self.popitem()
 
         super().__setitem__(key, value)
+        self._sizes[key] = new_size
 
     def __delitem__(self, key: Any) -> None:
-        if key in self:
-            old_value = self[key]
-            self.current_memory -= self._get_size(old_value)
-
         super().__delitem__(key)
+        self.current_memory -= self._sizes.pop(key, 0)
+
+    def clear(self) -> None:
+        # cachetools clears its storage directly rather than via __delitem__
+        super().clear()
+        self._sizes.clear()
+        self.current_memory = 0
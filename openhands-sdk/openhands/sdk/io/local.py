@@ -36,7 +36,10 @@ class LocalFileStore(FileStore):
             root = os.path.expanduser(root)
         root = os.path.abspath(os.path.normpath(root))
         self.root = root
+        self._root_prefix = os.path.join(root, "")
         os.makedirs(self.root, exist_ok=True)
+        # Directories known to exist, so repeated writes skip os.makedirs
+        self._known_dirs: set[str] = {self.root}
         self.cache = MemoryLRUCache(cache_memory_size, cache_limit_size)
 
     def get_full_path(self, path: str) -> str:
@@ -45,11 +48,10 @@ class LocalFileStore(FileStore):
             path = path[1:]
         # normalize path separators to handle both Unix (/) and Windows (\) styles
         normalized_path = path.replace("\\", "/")
-        full = os.path.abspath(
-            os.path.normpath(os.path.join(self.root, normalized_path))
-        )
+        # root is already absolute and normalized, so normpath alone suffices
+        full = os.path.normpath(os.path.join(self.root, normalized_path))
         # ensure sandboxing
-        if os.path.commonpath([self.root, full]) != self.root:
+        if full != self.root and not full.startswith(self._root_prefix):
             raise ValueError(f"path escapes filestore root: {path}")
 
         return full
@@ -57,16 +59,35 @@ class LocalFileStore(FileStore):
     @observe(name="LocalFileStore.write", span_type="TOOL")
     def write(self, path: str, contents: str | bytes) -> None:
         full_path = self.get_full_path(path)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        parent = os.path.dirname(full_path)
+        if parent not in self._known_dirs:
+            os.makedirs(parent, exist_ok=True)
+            self._known_dirs.add(parent)
+        try:
+            self._write_file(full_path, contents)
+        except FileNotFoundError:
+            # The directory was removed outside this store (e.g. by another
+            # store sharing the root), so recreate it and retry once.
+            self._known_dirs.discard(parent)
+            os.makedirs(parent, exist_ok=True)
+            self._known_dirs.add(parent)
+            self._write_file(full_path, contents)
+
+        if isinstance(contents, str):
+            self.cache[full_path] = contents
+        else:
+            # Don't cache binary content - LocalFileStore is meant for JSON data
+            # If binary data is written and then read, it will error on read.
+            # Drop any previously cached text so it can't be served stale.
+            self.cache.pop(full_path, None)
+
+    def _write_file(self, full_path: str, contents: str | bytes) -> None:
         if isinstance(contents, str):
             with open(full_path, "w", encoding="utf-8") as f:
                 f.write(contents)
-            self.cache[full_path] = contents
         else:
             with open(full_path, "wb") as f:
                 f.write(contents)
-            # Don't cache binary content - LocalFileStore is meant for JSON data
-            # If binary data is written and then read, it will error on read
 
     def read(self, path: str) -> str:
         full_path = self.get_full_path(path)
@@ -74,11 +95,11 @@ class LocalFileStore(FileStore):
         if full_path in self.cache:
             return self.cache[full_path]
 
-        if not os.path.exists(full_path):
-            raise FileNotFoundError(path)
-
-        with open(full_path, encoding="utf-8") as f:
-            result = f.read()
+        try:
+            with open(full_path, encoding="utf-8") as f:
+                result = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(path) from None
 
         self.cache[full_path] = result
         return result
@@ -93,10 +114,13 @@ class LocalFileStore(FileStore):
         if os.path.isfile(full_path):
             return [path]
 
-        # Otherwise it's a directory, return its contents
-        files = [os.path.join(path, f) for f in os.listdir(full_path)]
-        files = [f + "/" if os.path.isdir(self.get_full_path(f)) else f for f in files]
-        return files
+        # Otherwise it's a directory, return its contents. scandir exposes the
+        # entry type from the directory listing, so no per-entry stat is needed.
+        with os.scandir(full_path) as entries:
+            return [
+                os.path.join(path, entry.name) + ("/" if entry.is_dir() else "")
+                for entry in entries
+            ]
 
     @observe(name="LocalFileStore.delete", span_type="TOOL")
     def delete(self, path: str) -> None:
@@ -108,12 +132,29 @@ class LocalFileStore(FileStore):
 
             if os.path.isfile(full_path):
                 os.remove(full_path)
-                del self.cache[full_path]
+                self.cache.pop(full_path, None)
                 logger.debug(f"Removed local file: {full_path}")
             elif os.path.isdir(full_path):
                 shutil.rmtree(full_path)
-                self.cache.clear()
+                self._cache_delete(full_path)
+                prefix = os.path.join(full_path, "")
+                self._known_dirs = {
+                    d
+                    for d in self._known_dirs
+                    if d != full_path and not d.startswith(prefix)
+                }
                 logger.debug(f"Removed local directory: {full_path}")
 
         except Exception as e:
             logger.error(f"Error clearing local file store: {str(e)}")
+
+    def _cache_delete(self, dir_path: str) -> None:
+        """Drop cached entries for files under a deleted directory.
+
+        Only keys below ``dir_path`` are removed so unrelated entries stay warm.
+        The cache is bounded by ``cache_limit_size``, so a scan of its keys is
+        cheap compared to the ``rmtree`` that precedes it.
+        """
+        prefix = os.path.join(dir_path, "")
+        for key in [key for key in self.cache if key.startswith(prefix)]:
+            del self.cache[key]
@@ -10,6 +10,11 @@ import re
 # - ZWJ is invisible and doesn't affect text rendering or selection
 ZWJ = "\u200d"
 
+# Pattern to match @OpenHands mentions at word boundaries
+# Uses re.IGNORECASE so we don't need [Oo]pen[Hh]ands
+# Capture group preserves the original case
+_OPENHANDS_MENTION_RE = re.compile(r"@(OpenHands)\b", re.IGNORECASE)
+
 
 def sanitize_openhands_mentions(text: str) -> str:
     """Sanitize @OpenHands mentions in text to prevent self-mention loops.
@@ -32,13 +37,11 @@ def sanitize_openhands_mentions(text: str) -> str:
         >>> sanitize_openhands_mentions("No mention here")
         'No mention here'
     """
-    # Pattern to match @OpenHands mentions at word boundaries
-    # Uses re.IGNORECASE so we don't need [Oo]pen[Hh]ands
-    # Capture group preserves the original case
-    pattern = r"@(OpenHands)\b"
+    # Most text has no mention at all; a C-level substring check is far
+    # cheaper than running the case-insensitive regex over the whole input
+    if "@" not in text:
+        return text
 
     # Replace @ with @ + ZWJ while preserving the original case
     # The \1 backreference preserves the matched case
-    sanitized = re.sub(pattern, f"@{ZWJ}\\1", text, flags=re.IGNORECASE)
-
-    return sanitized
+    return _OPENHANDS_MENTION_RE.sub(f"@{ZWJ}\\1", text)
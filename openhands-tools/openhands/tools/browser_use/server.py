@@ -1,3 +1,6 @@
+import asyncio
+import json
+
 from browser_use.dom.markdown_extractor import extract_clean_markdown
 
 from openhands.sdk import get_logger
@@ -15,8 +18,6 @@ class CustomBrowserUseServer(LogSafeBrowserUseServer):
 
     async def _get_storage(self) -> str:
         """Get browser storage (cookies, local storage, session storage)."""
-        import json
-
         if not self.browser_session:
             return "Error: No browser session active"
 
@@ -52,46 +53,49 @@ class CustomBrowserUseServer(LogSafeBrowserUseServer):
                 )
 
                 try:
+                    items = []
                     for origin_data in origins:
                         origin = origin_data.get("origin")
                         if not origin:
                             continue
 
-                        dom_storage = cdp_session.cdp_client.send.DOMStorage
-
-                        # Set localStorage
-                        for item in origin_data.get("localStorage", []):
-                            key = item.get("key") or item.get("name")
-                            if not key:
-                                continue
-                            await dom_storage.setDOMStorageItem(
-                                params={
-                                    "storageId": {
-                                        "securityOrigin": origin,
-                                        "isLocalStorage": True,
-                                    },
-                                    "key": key,
-                                    "value": item["value"],
-                                },
-                                session_id=cdp_session.session_id,
-                            )
-
-                        # Set sessionStorage
-                        for item in origin_data.get("sessionStorage", []):
-                            key = item.get("key") or item.get("name")
-                            if not key:
-                                continue
-                            await dom_storage.setDOMStorageItem(
+                        for storage_key, is_local_storage in (
+                            ("localStorage", True),
+                            ("sessionStorage", False),
+                        ):
+                            for item in origin_data.get(storage_key, []):
+                                key = item.get("key") or item.get("name")
+                                if not key:
+                                    continue
+                                items.append(
+                                    (origin, is_local_storage, key, item["value"])
+                                )
+
+                    # Send all items concurrently over the CDP connection
+                    # instead of awaiting one round trip per item. Wait for
+                    # every command before disabling DOMStorage, then surface
+                    # the first failure.
+                    dom_storage = cdp_session.cdp_client.send.DOMStorage
+                    results = await asyncio.gather(
+                        *(
+                            dom_storage.setDOMStorageItem(
                                 params={
                                     "storageId": {
                                         "securityOrigin": origin,
-                                        "isLocalStorage": False,
+                                        "isLocalStorage": is_local_storage,
                                     },
                                     "key": key,
-                                    "value": item["value"],
+                                    "value": value,
                                 },
                                 session_id=cdp_session.session_id,
                             )
+                            for origin, is_local_storage, key, value in items
+                        ),
+                        return_exceptions=True,
+                    )
+                    for result in results:
+                        if isinstance(result, BaseException):
+                            raise result
                 finally:
                     # Disable DOMStorage
                     await cdp_session.cdp_client.send.DOMStorage.disable(
@@ -123,38 +127,37 @@ class CustomBrowserUseServer(LogSafeBrowserUseServer):
         # Original content length for processing
         final_filtered_length = content_stats["final_filtered_chars"]
 
+        # Work with offsets into the full content and slice it only once
+        content_length = len(content)
         if start_from_char > 0:
-            if start_from_char >= len(content):
-                return f"start_from_char ({start_from_char}) exceeds content length ({len(content)}). Content has {final_filtered_length} characters after filtering."  # noqa: E501
+            if start_from_char >= content_length:
+                return f"start_from_char ({start_from_char}) exceeds content length ({content_length}). Content has {final_filtered_length} characters after filtering."  # noqa: E501
 
-            content = content[start_from_char:]
             content_stats["started_from_char"] = start_from_char
 
         # Smart truncation with context preservation
         truncated = False
-        if len(content) > MAX_CHAR_LIMIT:
+        end = content_length
+        if content_length - start_from_char > MAX_CHAR_LIMIT:
             # Try to truncate at a natural break point (paragraph, sentence)
-            truncate_at = MAX_CHAR_LIMIT
+            limit = start_from_char + MAX_CHAR_LIMIT
+            end = limit
 
             # Look for paragraph break within last 500 chars of limit
-            paragraph_break = content.rfind(
-                "\n\n", MAX_CHAR_LIMIT - 500, MAX_CHAR_LIMIT
-            )
+            paragraph_break = content.rfind("\n\n", limit - 500, limit)
             if paragraph_break > 0:
-                truncate_at = paragraph_break
+                end = paragraph_break
             else:
                 # Look for sentence break within last 200 chars of limit
-                sentence_break = content.rfind(
-                    ".", MAX_CHAR_LIMIT - 200, MAX_CHAR_LIMIT
-                )
+                sentence_break = content.rfind(".", limit - 200, limit)
                 if sentence_break > 0:
-                    truncate_at = sentence_break + 1
+                    end = sentence_break + 1
 
-            content = content[:truncate_at]
             truncated = True
-            next_start = (start_from_char or 0) + truncate_at
-            content_stats["truncated_at_char"] = truncate_at
-            content_stats["next_start_char"] = next_start
+            content_stats["truncated_at_char"] = end - start_from_char
+            content_stats["next_start_char"] = end
+
+        content = content[start_from_char:end]
 
         # Add content statistics to the result
         original_html_length = content_stats["original_html_chars"]
@@ -163,8 +166,8 @@ class CustomBrowserUseServer(LogSafeBrowserUseServer):
 
         stats_summary = (
             f"Content processed: {original_html_length:,}"
-            + f" HTML chars → {initial_markdown_length:,}"
-            + f" initial markdown → {final_filtered_length:,} filtered markdown"
+            f" HTML chars → {initial_markdown_length:,}"
+            f" initial markdown → {final_filtered_length:,} filtered markdown"
         )
         if start_from_char > 0:
             stats_summary += f" (started from char {start_from_char:,})"
@@ -36,15 +36,25 @@ def agent_server():
     process = multiprocessing.Process(target=run_agent_server, args=(port, api_key))
     process.start()
 
-    for _ in range(30):
+    # Probe the listening socket with a raw TCP connect, which fails fast while
+    # the server is still starting, and only issue the HTTP check once it
+    # accepts connections. Keep retrying until the deadline if the app is not
+    # serving yet.
+    ready = False
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
         try:
-            response = requests.get(f"http://127.0.0.1:{port}/docs", timeout=1)
-            if response.status_code == 200:
-                break
-        except requests.exceptions.ConnectionError:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.1):
+                pass
+            response = requests.get(f"http://127.0.0.1:{port}/docs", timeout=5)
+            ready = response.status_code == 200
+        except (OSError, requests.exceptions.RequestException):
             pass
-        time.sleep(2)
-    else:
+        if ready:
+            break
+        time.sleep(0.1)
+
+    if not ready:
         process.terminate()
         process.join()
         pytest.fail(f"Agent server failed to start on port {port}")
@@ -5,13 +5,18 @@ test failures early and terminate execution before the full trajectory
 completes, reducing LLM costs.
 """
 
+import re
 from abc import ABC, abstractmethod
+from itertools import islice
+from typing import ClassVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from openhands.sdk.event.base import Event
 from openhands.sdk.event.llm_convertible.action import ActionEvent
 from openhands.sdk.logger import get_logger
+from openhands.tools.file_editor.definition import FileEditorAction, FileEditorTool
+from openhands.tools.terminal.definition import TerminalAction, TerminalTool
 
 
 logger = get_logger(__name__)
@@ -20,10 +25,16 @@ logger = get_logger(__name__)
 class EarlyStopResult(BaseModel):
     """Result from an early stopping check."""
 
+    model_config = ConfigDict(frozen=True)
+
     should_stop: bool
     reason: str | None = None
 
 
+# Shared result for the common "keep going" case, returned after every event
+_NO_STOP = EarlyStopResult(should_stop=False)
+
+
 class EarlyStopperBase(ABC):
     """Base class for early stopping conditions.
 
@@ -31,28 +42,94 @@ class EarlyStopperBase(ABC):
     early termination when definitive failure patterns are detected.
     This saves LLM costs by avoiding running the full trajectory
     for tests that have already failed.
+
+    ``check`` is called after every new event with the same, growing list
+    of events. The base class remembers how many events were already
+    inspected, so subclasses only implement ``check_event`` for one event.
     """
 
-    @abstractmethod
+    # Class-level defaults so subclasses need not call super().__init__()
+    _cursor: int = 0
+    _stop_result: EarlyStopResult | None = None
+
     def check(self, events: list[Event]) -> EarlyStopResult:
         """Check if early stopping should be triggered.
 
         Args:
-            events: List of conversation events collected so far
+            events: List of conversation events collected so far. Each call
+                receives the previous list with new events appended.
 
         Returns:
             EarlyStopResult indicating whether to stop and why
         """
+        if self._stop_result is not None:
+            return self._stop_result
+
+        # A shorter list is not a continuation of the previous one
+        if len(events) < self._cursor:
+            self._cursor = 0
+
+        result = self.check_incremental(events, self._cursor)
+        self._cursor = len(events)
+        if result.should_stop:
+            self._stop_result = result
+        return result
+
+    def check_incremental(self, events: list[Event], start_idx: int) -> EarlyStopResult:
+        """Check only the events from ``start_idx`` onwards."""
+        for event in islice(events, start_idx, None):
+            result = self.check_event(event)
+            if result is not None:
+                return result
+
+        return _NO_STOP
+
+    @abstractmethod
+    def check_event(self, event: Event) -> EarlyStopResult | None:
+        """Check a single new event.
+
+        Returns:
+            EarlyStopResult if this event should stop the run, otherwise None
+        """
+        pass
+
+
+class ActionEventStopper(EarlyStopperBase):
+    """Base class for stoppers that only inspect agent actions.
+
+    Most conversation events are messages and observations, so stoppers that
+    only care about ActionEvents can be skipped for everything else. Setting
+    ``tool_name`` further restricts the stopper to actions of that tool.
+    """
+
+    tool_name: ClassVar[str | None] = None
+
+    def check_event(self, event: Event) -> EarlyStopResult | None:
+        if isinstance(event, ActionEvent) and (
+            self.tool_name is None or event.tool_name == self.tool_name
+        ):
+            return self.check_action(event)
+        return None
+
+    @abstractmethod
+    def check_action(self, event: ActionEvent) -> EarlyStopResult | None:
+        """Check a single new action event.
+
+        Returns:
+            EarlyStopResult if this action should stop the run, otherwise None
+        """
         pass
 
 
-class FileEditPruner(EarlyStopperBase):
+class FileEditPruner(ActionEventStopper):
     """Stop early if file editing operations are detected.
 
     Useful for tests where the agent should NOT edit files,
     such as b01_no_premature_implementation.
     """
 
+    tool_name = FileEditorTool.name
+
     def __init__(self, forbidden_commands: list[str] | None = None):
         """Initialize the pruner.
 
@@ -60,46 +137,33 @@ class FileEditPruner(EarlyStopperBase):
             forbidden_commands: List of file editor commands to detect.
                 Defaults to ["create", "str_replace", "insert", "undo_edit"]
         """
-        self.forbidden_commands = forbidden_commands or [
-            "create",
-            "str_replace",
-            "insert",
-            "undo_edit",
-        ]
-
-    def check(self, events: list[Event]) -> EarlyStopResult:
-        """Check if any file editing operations were performed."""
-        from openhands.tools.file_editor.definition import (
-            FileEditorAction,
-            FileEditorTool,
+        self.forbidden_commands = frozenset(
+            forbidden_commands or ["create", "str_replace", "insert", "undo_edit"]
         )
 
-        for event in events:
-            if (
-                isinstance(event, ActionEvent)
-                and event.tool_name == FileEditorTool.name
-            ):
-                if event.action is not None and isinstance(
-                    event.action, FileEditorAction
-                ):
-                    if event.action.command in self.forbidden_commands:
-                        return EarlyStopResult(
-                            should_stop=True,
-                            reason=(
-                                f"Detected forbidden file operation: "
-                                f"{event.action.command} on {event.action.path}"
-                            ),
-                        )
-
-        return EarlyStopResult(should_stop=False)
-
-
-class BashCommandPruner(EarlyStopperBase):
+    def check_action(self, event: ActionEvent) -> EarlyStopResult | None:
+        """Check if the action is a forbidden file editing operation."""
+        if event.action is not None and isinstance(event.action, FileEditorAction):
+            if event.action.command in self.forbidden_commands:
+                return EarlyStopResult(
+                    should_stop=True,
+                    reason=(
+                        f"Detected forbidden file operation: "
+                        f"{event.action.command} on {event.action.path}"
+                    ),
+                )
+
+        return None
+
+
+class BashCommandPruner(ActionEventStopper):
     """Stop early if specific bash commands are detected.
 
     Useful for tests that should avoid certain terminal operations.
     """
 
+    tool_name = TerminalTool.name
+
     def __init__(self, forbidden_patterns: list[str]):
         """Initialize the pruner.
 
@@ -108,48 +172,75 @@ class BashCommandPruner(EarlyStopperBase):
                 Uses substring matching.
         """
         self.forbidden_patterns = forbidden_patterns
-
-    def check(self, events: list[Event]) -> EarlyStopResult:
-        """Check if any forbidden bash commands were executed."""
-        from openhands.tools.terminal.definition import (
-            TerminalAction,
-            TerminalTool,
+        # A single alternation scans each command once instead of once per
+        # pattern. An empty alternation would match everything, so skip it.
+        self._pattern_re = (
+            re.compile("|".join(map(re.escape, forbidden_patterns)))
+            if forbidden_patterns
+            else None
         )
 
-        for event in events:
-            if isinstance(event, ActionEvent) and event.tool_name == TerminalTool.name:
-                if event.action is not None and isinstance(
-                    event.action, TerminalAction
-                ):
-                    command = event.action.command
-                    for pattern in self.forbidden_patterns:
-                        if pattern in command:
-                            return EarlyStopResult(
-                                should_stop=True,
-                                reason=(
-                                    f"Detected forbidden command pattern "
-                                    f"'{pattern}' in: {command[:100]}"
-                                ),
-                            )
-
-        return EarlyStopResult(should_stop=False)
+    def check_action(self, event: ActionEvent) -> EarlyStopResult | None:
+        """Check if the action executes a forbidden bash command."""
+        if self._pattern_re is None:
+            return None
+
+        if event.action is not None and isinstance(event.action, TerminalAction):
+            command = event.action.command
+            match = self._pattern_re.search(command)
+            if match is not None:
+                return EarlyStopResult(
+                    should_stop=True,
+                    reason=(
+                        f"Detected forbidden command pattern "
+                        f"'{match.group(0)}' in: {command[:100]}"
+                    ),
+                )
+
+        return None
 
 
 class CompositeEarlyStopper(EarlyStopperBase):
     """Combine multiple early stoppers.
 
-    Stops if ANY of the contained stoppers triggers.
+    Stops if ANY of the contained stoppers triggers. New events are scanned
+    once and each event is handed to the contained stoppers in order, skipping
+    action stoppers that cannot match the event's type or tool.
     """
 
     def __init__(self, stoppers: list[EarlyStopperBase]):
         """Initialize with a list of stoppers to combine."""
         self.stoppers = stoppers
-
-    def check(self, events: list[Event]) -> EarlyStopResult:
-        """Check all contained stoppers, stop if any triggers."""
-        for stopper in self.stoppers:
-            result = stopper.check(events)
-            if result.should_stop:
+        self._non_action_stoppers = [
+            stopper
+            for stopper in stoppers
+            if not isinstance(stopper, ActionEventStopper)
+        ]
+        # Stoppers relevant to each action tool name, built on first use
+        self._stoppers_by_tool: dict[str, list[EarlyStopperBase]] = {}
+
+    def _stoppers_for_tool(self, tool_name: str) -> list[EarlyStopperBase]:
+        stoppers = self._stoppers_by_tool.get(tool_name)
+        if stoppers is None:
+            stoppers = [
+                stopper
+                for stopper in self.stoppers
+                if not isinstance(stopper, ActionEventStopper)
+                or stopper.tool_name in (None, tool_name)
+            ]
+            self._stoppers_by_tool[tool_name] = stoppers
+        return stoppers
+
+    def check_event(self, event: Event) -> EarlyStopResult | None:
+        """Check the event against the relevant contained stoppers."""
+        if isinstance(event, ActionEvent):
+            stoppers = self._stoppers_for_tool(event.tool_name)
+        else:
+            stoppers = self._non_action_stoppers
+
+        for stopper in stoppers:
+            result = stopper.check_event(event)
+            if result is not None:
                 return result
 
-        return EarlyStopResult(should_stop=False)
+        return None
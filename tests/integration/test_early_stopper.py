@@ -2,12 +2,17 @@
 
 from typing import cast
 
+import pytest
+from pydantic import ValidationError
+
+from openhands.sdk.event import MessageEvent
 from openhands.sdk.event.base import Event
 from openhands.sdk.event.llm_convertible.action import ActionEvent
-from openhands.sdk.llm import MessageToolCall, TextContent
+from openhands.sdk.llm import Message, MessageToolCall, TextContent
 from openhands.tools.file_editor.definition import CommandLiteral, FileEditorAction
 from openhands.tools.terminal.definition import TerminalAction
 from tests.integration.early_stopper import (
+    ActionEventStopper,
     BashCommandPruner,
     CompositeEarlyStopper,
     EarlyStopResult,
@@ -105,6 +110,40 @@ class TestFileEditPruner:
         result = pruner.check(cast(list[Event], [event]))
         assert result.should_stop is False
 
+    def test_incremental_checks_on_growing_events(self):
+        """Events appended between checks should still be detected."""
+        pruner = FileEditPruner()
+        events = cast(list[Event], [create_file_editor_event("view", "/tmp")])
+        assert pruner.check(events).should_stop is False
+
+        events.append(create_file_editor_event("create", "/tmp/test.py"))
+        result = pruner.check(events)
+        assert result.should_stop is True
+
+        # Once triggered, the same result is returned for later checks
+        events.append(create_file_editor_event("view", "/tmp"))
+        assert pruner.check(events) is result
+
+    def test_shorter_event_list_is_rescanned(self):
+        """A list shorter than the previous one is checked from the start."""
+        pruner = FileEditPruner()
+        view = create_file_editor_event("view", "/tmp")
+        assert pruner.check(cast(list[Event], [view, view])).should_stop is False
+
+        create = create_file_editor_event("create", "/tmp/test.py")
+        assert pruner.check(cast(list[Event], [create])).should_stop is True
+
+    def test_subclass_without_super_init(self):
+        """Subclasses that skip super().__init__() still check events."""
+
+        class NoInitPruner(FileEditPruner):
+            def __init__(self):
+                self.forbidden_commands = frozenset({"create"})
+
+        pruner = NoInitPruner()
+        event = create_file_editor_event("create", "/tmp/test.py")
+        assert pruner.check(cast(list[Event], [event])).should_stop is True
+
 
 class TestBashCommandPruner:
     """Tests for BashCommandPruner."""
@@ -131,6 +170,24 @@ class TestBashCommandPruner:
         result = pruner.check(cast(list[Event], [event]))
         assert result.should_stop is False
 
+    def test_patterns_are_matched_literally(self):
+        """Patterns containing regex metacharacters match as plain substrings."""
+        pruner = BashCommandPruner(forbidden_patterns=["rm -rf", "pip install .[dev]"])
+        safe = create_terminal_event(command="pip install -e dev")
+        assert pruner.check(cast(list[Event], [safe])).should_stop is False
+
+        event = create_terminal_event(command="cd repo && pip install .[dev]")
+        result = pruner.check(cast(list[Event], [safe, event]))
+        assert result.should_stop is True
+        assert result.reason is not None
+        assert "pip install .[dev]" in result.reason
+
+    def test_empty_patterns_never_stop(self):
+        """No patterns means no command is forbidden."""
+        pruner = BashCommandPruner(forbidden_patterns=[])
+        event = create_terminal_event(command="rm -rf /")
+        assert pruner.check(cast(list[Event], [event])).should_stop is False
+
 
 class TestCompositeEarlyStopper:
     """Tests for CompositeEarlyStopper."""
@@ -164,6 +221,62 @@ class TestCompositeEarlyStopper:
         result = composite.check(cast(list[Event], [event]))
         assert result.should_stop is False
 
+    def test_detects_events_appended_between_checks(self):
+        """Each contained stopper should see events added after a check."""
+        composite = CompositeEarlyStopper(
+            stoppers=[
+                FileEditPruner(),
+                BashCommandPruner(forbidden_patterns=["dangerous"]),
+            ]
+        )
+        events = cast(list[Event], [create_terminal_event(command="ls -la")])
+        assert composite.check(events).should_stop is False
+
+        events.append(create_terminal_event(command="run dangerous thing"))
+        result = composite.check(events)
+        assert result.should_stop is True
+        assert result.reason is not None
+        assert "dangerous" in result.reason
+
+    def test_non_action_events_skip_action_stoppers(self):
+        """Action-only stoppers should never see non-action events."""
+        seen: list[Event] = []
+
+        class RecordingStopper(ActionEventStopper):
+            def check_action(self, event: ActionEvent) -> EarlyStopResult | None:
+                seen.append(event)
+                return None
+
+        composite = CompositeEarlyStopper(stoppers=[RecordingStopper()])
+        message = MessageEvent(
+            source="user",
+            llm_message=Message(role="user", content=[TextContent(text="hi")]),
+        )
+        action = create_terminal_event(command="ls -la")
+        result = composite.check(cast(list[Event], [message, action]))
+        assert result.should_stop is False
+        assert seen == [action]
+
+    def test_tool_stoppers_only_see_their_tool(self):
+        """Stoppers bound to a tool should only receive that tool's actions."""
+        seen: list[ActionEvent] = []
+
+        class RecordingTerminalStopper(ActionEventStopper):
+            tool_name = "terminal"
+
+            def check_action(self, event: ActionEvent) -> EarlyStopResult | None:
+                seen.append(event)
+                return None
+
+        composite = CompositeEarlyStopper(
+            stoppers=[RecordingTerminalStopper(), FileEditPruner()]
+        )
+        terminal = create_terminal_event(command="ls -la")
+        edit = create_file_editor_event(command="create", path="/test.py")
+        result = composite.check(cast(list[Event], [terminal, edit]))
+        assert result.should_stop is True
+        assert seen == [terminal]
+
 
 class TestEarlyStopResult:
     """Tests for EarlyStopResult model."""
@@ -179,3 +292,9 @@ class TestEarlyStopResult:
         result = EarlyStopResult(should_stop=True, reason="Test reason")
         assert result.should_stop is True
         assert result.reason == "Test reason"
+
+    def test_is_immutable(self):
+        """Results are shared between checks, so they must not be mutable."""
+        result = FileEditPruner().check([])
+        with pytest.raises(ValidationError):
+            result.should_stop = True  # type: ignore[misc]
@@ -7,6 +7,8 @@ This module tests:
 4. Handling of large numbers of events without OOM
 """
 
+import os
+import shutil
 import tempfile
 import time
 
@@ -127,6 +129,20 @@ def test_cache_invalidation_on_write():
         assert cached_content == "updated"
 
 
+def test_cache_invalidation_on_bytes_write():
+    """Test that writing bytes drops a previously cached text entry."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = LocalFileStore(temp_dir, cache_limit_size=10)
+
+        store.write("test.txt", "original")
+        full_path = store.get_full_path("test.txt")
+        assert full_path in store.cache
+
+        store.write("test.txt", b"updated")
+        assert full_path not in store.cache
+        assert store.read("test.txt") == "updated"
+
+
 def test_cache_invalidation_on_delete():
     """Test that cache is cleared when file is deleted."""
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -173,6 +189,58 @@ def test_cache_directory_deletion():
         assert full_path2 not in store.cache
 
 
+def test_write_after_directory_deletion_recreates_directory():
+    """Test that writes still create directories removed by delete."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = LocalFileStore(temp_dir, cache_limit_size=10)
+
+        store.write("subdir/nested/file.txt", "content1")
+        store.delete("subdir")
+        store.write("subdir/nested/file.txt", "content2")
+
+        store.cache.clear()
+        assert store.read("subdir/nested/file.txt") == "content2"
+
+        store.delete("")
+        store.write("file.txt", "content3")
+        store.cache.clear()
+        assert store.read("file.txt") == "content3"
+
+
+def test_write_after_external_directory_removal():
+    """Test that writes recreate directories removed outside the store."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = LocalFileStore(temp_dir, cache_limit_size=10)
+        other = LocalFileStore(temp_dir, cache_limit_size=10)
+
+        store.write("x/f.txt", "content1")
+        other.delete("x")
+        store.write("x/f.txt", "content2")
+        assert other.read("x/f.txt") == "content2"
+
+        shutil.rmtree(os.path.join(temp_dir, "x"))
+        store.write("x/f.txt", b"content3")
+        assert os.path.exists(os.path.join(temp_dir, "x", "f.txt"))
+
+
+def test_cache_directory_deletion_keeps_unrelated_entries():
+    """Test that deleting a directory only evicts entries below it."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = LocalFileStore(temp_dir, cache_limit_size=10)
+
+        store.write("subdir/file1.txt", "content1")
+        store.write("subdir2/file2.txt", "content2")
+        store.write("other.txt", "content3")
+
+        store.delete("subdir")
+
+        assert store.get_full_path("subdir/file1.txt") not in store.cache
+        # Sibling with a shared name prefix and top-level files stay cached
+        assert store.get_full_path("subdir2/file2.txt") in store.cache
+        assert store.get_full_path("other.txt") in store.cache
+        assert store.cache.current_memory == len("content2") + len("content3")
+
+
 def test_large_number_of_events_no_oom():
     """Test that store can handle many events without OOM.
 
@@ -312,3 +380,24 @@ def test_cache_with_evict_correct():
     total_len = len(cache["key2"]) + len(cache["key3"])
     # Verify memory statistics match the total size of key2 and key3
     assert total_len == cache.current_memory
+
+
+def test_cache_memory_accounting_on_overwrite():
+    cache = MemoryLRUCache(1000, 2)
+    cache["key1"] = "a" * 600
+    cache["key2"] = "b" * 300
+    # Overwriting a key must not double-count its old size
+    cache["key1"] = "c" * 500
+    assert "key1" in cache and "key2" in cache
+    assert cache.current_memory == 800
+
+    # Growing the entry past max_memory evicts others, not its own old size
+    cache["key1"] = "d" * 900
+    assert "key1" in cache and "key2" not in cache
+    assert cache.current_memory == 900
+
+    del cache["key1"]
+    assert cache.current_memory == 0
+    cache["key2"] = "e" * 10
+    cache.clear()
+    assert cache.current_memory == 0
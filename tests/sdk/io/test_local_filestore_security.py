@@ -121,3 +121,15 @@ def test_file_operations_with_security():
         # Test that we can't read outside the root
         with pytest.raises(ValueError, match="path escapes filestore root"):
             store.read("../outside.txt")
+
+
+def test_list_marks_directories_with_trailing_slash():
+    """Test that list returns files as-is and directories with a trailing slash."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = LocalFileStore(temp_dir)
+        store.write("dir/file.txt", "content")
+        store.write("dir/nested/inner.txt", "content")
+
+        assert sorted(store.list("dir")) == ["dir/file.txt", "dir/nested/"]
+        assert store.list("dir/file.txt") == ["dir/file.txt"]
+        assert store.list("missing") == []
@@ -70,9 +70,12 @@ def test_normalize_responses_kwargs_policy():
     llm.enable_encrypted_reasoning = True
     llm.max_output_tokens = 128
 
+    include = ["text.output_text"]
     out = select_responses_options(
-        llm, {"temperature": 0.3}, include=["text.output_text"], store=None
+        llm, {"temperature": 0.3}, include=include, store=None
     )
+    # Caller's include list is not mutated
+    assert include == ["text.output_text"]
     # Temperature forced to 1.0 for Responses path
     assert out["temperature"] == 1.0
     assert out["tool_choice"] == "auto"
@@ -109,11 +112,15 @@ def test_normalize_responses_kwargs_encrypted_reasoning_disabled():
     # Explicitly disable encrypted reasoning (also the default)
     llm.enable_encrypted_reasoning = False
 
-    out = select_responses_options(llm, {}, include=["text.output_text"], store=None)
+    include = ["text.output_text"]
+    out = select_responses_options(llm, {}, include=include, store=None)
     # encrypted_content should NOT be in the include list
     assert "reasoning.encrypted_content" not in out.get("include", [])
     # But the original include item should still be there
     assert "text.output_text" in out["include"]
+    # The caller's list is not shared with the outgoing kwargs
+    out["include"].append("other")
+    assert include == ["text.output_text"]
 
 
 @patch("openhands.sdk.llm.llm.litellm_responses")
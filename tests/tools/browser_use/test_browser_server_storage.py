@@ -0,0 +1,73 @@
+"""Tests for CustomBrowserUseServer storage handling with a mocked CDP session."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from openhands.tools.browser_use.server import CustomBrowserUseServer
+
+
+STORAGE_STATE = {
+    "origins": [
+        {
+            "origin": "https://example.com",
+            "localStorage": [
+                {"name": "a", "value": "1"},
+                {"name": "b", "value": "2"},
+            ],
+            "sessionStorage": [{"name": "c", "value": "3"}],
+        }
+    ]
+}
+
+
+def create_server(fail_key: str | None = None):
+    """Create a server whose CDP session records DOMStorage calls in order."""
+    calls: list[tuple[str, str | None]] = []
+
+    async def set_item(params, session_id):
+        # The failing item errors first while the others are still in flight
+        if params["key"] == fail_key:
+            raise RuntimeError(f"failed to set {fail_key}")
+        await asyncio.sleep(0.01)
+        calls.append(("set", params["key"]))
+
+    async def disable(session_id):
+        calls.append(("disable", None))
+
+    dom_storage = MagicMock()
+    dom_storage.enable = AsyncMock()
+    dom_storage.setDOMStorageItem = AsyncMock(side_effect=set_item)
+    dom_storage.disable = AsyncMock(side_effect=disable)
+
+    cdp_session = MagicMock()
+    cdp_session.session_id = "session"
+    cdp_session.cdp_client.send.DOMStorage = dom_storage
+
+    server = CustomBrowserUseServer()
+    server.browser_session = MagicMock()
+    server.browser_session.get_or_create_cdp_session = AsyncMock(
+        return_value=cdp_session
+    )
+    return server, calls
+
+
+async def test_set_storage_sends_all_items_before_disable():
+    """All items are sent and DOMStorage is disabled only afterwards."""
+    server, calls = create_server()
+
+    result = await server._set_storage(STORAGE_STATE)
+
+    assert result == "Storage set successfully"
+    assert sorted(calls[:-1]) == [("set", "a"), ("set", "b"), ("set", "c")]
+    assert calls[-1] == ("disable", None)
+
+
+async def test_set_storage_failure_waits_for_other_items():
+    """A failing item is reported only after the other items complete."""
+    server, calls = create_server(fail_key="a")
+
+    result = await server._set_storage(STORAGE_STATE)
+
+    assert result == "Error setting storage state: failed to set a"
+    assert sorted(calls[:-1]) == [("set", "b"), ("set", "c")]
+    assert calls[-1] == ("disable", None)